@@ -0,0 +1,55 @@
+"""Import-time benchmark: cost of importing the headless core (dsa_hub) in a fresh interpreter.
+
+Exits with status 1 if the median exceeds the budget or if tkinter got imported.
+Run from the repository root:
+    python benchmarks/import_time.py [--runs 20] [--budget-ms 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = """
+import sys, time
+start = time.perf_counter_ns()
+import {module}
+elapsed = time.perf_counter_ns() - start
+print(elapsed, int('tkinter' in sys.modules))
+"""
+
+
+def time_import(module, runs):
+    samples = []
+    tk_loaded = False
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module=module)], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.split()
+        samples.append(int(output[0]) / 1e6)
+        tk_loaded = tk_loaded or output[1] == "1"
+    return statistics.median(samples), min(samples), tk_loaded
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=10.0)
+    args = parser.parse_args()
+
+    failed = False
+    print(f"{'module':<16}{'median ms':>12}{'min ms':>10}  tkinter")
+    for module in ("dsa_hub", "main", "dsa_hub.gui"):
+        median, fastest, tk_loaded = time_import(module, args.runs)
+        print(f"{module:<16}{median:>12.2f}{fastest:>10.2f}  {'yes' if tk_loaded else 'no'}")
+        if module != "dsa_hub.gui" and (tk_loaded or median > args.budget_ms):
+            failed = True
+
+    if failed:
+        print(f"FAIL: core import must stay under {args.budget_ms} ms without tkinter")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Memory benchmark: bytes per element for the generic Node vs. slotted nodes.
+
+Run from the repository root:
+    python benchmarks/node_memory.py [count]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa_hub import (  # noqa: E402
+    Node, ListNode, TreeNode, LinkedList, BinarySearchTree, ArrayBinarySearchTree
+)
+
+
+def bytes_per_element(build, count):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    keep = build(count)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del keep
+    return (after - before) / count
+
+
+def build_nodes(node_class):
+    def build(count):
+        return [node_class(i) for i in range(count)]
+    return build
+
+
+def build_linked_list(count):
+    linked_list = LinkedList()
+    linked_list.extend(range(count))
+    return linked_list
+
+
+def build_bst(count):
+    bst = BinarySearchTree()
+    # Insert a fixed pseudo-random permutation so the tree stays shallow
+    for i in range(count):
+        bst.insert((i * 7919) % count)
+    return bst
+
+
+def build_array_bst(count):
+    return ArrayBinarySearchTree.from_sorted(range(count))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    # The node lists hold one extra list slot (8 bytes) per element
+    rows = [
+        ("Node (before)", build_nodes(Node)),
+        ("ListNode", build_nodes(ListNode)),
+        ("TreeNode", build_nodes(TreeNode)),
+        ("LinkedList", build_linked_list),
+        ("BinarySearchTree", build_bst),
+        ("ArrayBinarySearchTree", build_array_bst),
+    ]
+    print(f"{'structure':<24}{'bytes/element':>15}")
+    for name, build in rows:
+        print(f"{name:<24}{bytes_per_element(build, count):>15.1f}")
+
+
+if __name__ == "__main__":
+    main()
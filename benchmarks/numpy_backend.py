@@ -0,0 +1,92 @@
+"""NumPy engine benchmark: pure-Python vs. vectorized sort and search, with result checks.
+
+Search arrays are converted with as_array() once, outside the timing, as a
+caller running many searches would. Every vectorized result is compared against the pure-Python one before it is
+timed, and narrow integer dtypes (uint8, int32) are checked against keys outside
+their range; a mismatch exits with status 1. Needs NumPy; without it the script
+says so and exits with status 2.
+
+Run from the repository root:
+    python benchmarks/numpy_backend.py [size ...]
+"""
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa_hub import SortingAlgorithms, SearchAlgorithms, measure_ns, format_ns  # noqa: E402
+from dsa_hub import vectorized  # noqa: E402
+
+SEARCHES = 1000
+
+
+def check(label, ok):
+    if not ok:
+        print(f"MISMATCH: {label}")
+        sys.exit(1)
+
+
+def check_dtypes():
+    """Narrow arrays must not wrap keys outside their range into matches"""
+    for dtype in ("uint8", "int32"):
+        values = vectorized.np.arange(0, 256, 3, dtype=dtype)
+        ordered = values.tolist()
+        for target in (-1, 0, 3, 4, 255, 256, 300, 1 << 40, -(1 << 40)):
+            expected = SearchAlgorithms.binary_search(ordered, target)
+            check(f"{dtype} binary search target={target}", vectorized.binary_search(values, target) == expected)
+            check(f"{dtype} batch binary search target={target}",
+                  vectorized.batch_binary_search(values, [target]) == [expected])
+            check(f"{dtype} linear search target={target}",
+                  vectorized.linear_search(values, target) == SearchAlgorithms.linear_search(ordered, target))
+
+
+def compare(size, rng):
+    data = [rng.randrange(-size * 10, size * 10) for _ in range(size)]
+    ordered = sorted(data)
+    values = vectorized.as_array(data)
+    sorted_values = vectorized.as_array(ordered)
+    targets = [rng.choice(data) if i % 2 else rng.randrange(-size * 10, size * 10) for i in range(SEARCHES)]
+
+    check(f"sort n={size}", vectorized.sort(data) == ordered)
+    batch = vectorized.batch_binary_search(sorted_values, targets)
+    for target, index in zip(targets, batch):
+        expected = SearchAlgorithms.binary_search(ordered, target)
+        check(f"binary search n={size} target={target}",
+              (index == -1) == (expected == -1) and (index == -1 or ordered[index] == target))
+    for target in targets[:20]:
+        check(f"linear search n={size} target={target}",
+              vectorized.linear_search(values, target) == SearchAlgorithms.linear_search(data, target))
+
+    absent = -size * 10 - 1
+
+    def pure_batch():
+        for target in targets:
+            SearchAlgorithms.binary_search(ordered, target)
+
+    return [
+        ("quick sort", measure_ns(SortingAlgorithms.quick_sort, data),
+         measure_ns(vectorized.sort, data)),
+        (f"{SEARCHES} binary searches", measure_ns(pure_batch),
+         measure_ns(vectorized.batch_binary_search, sorted_values, targets)),
+        ("linear search (absent)", measure_ns(SearchAlgorithms.linear_search, data, absent),
+         measure_ns(vectorized.linear_search, values, absent)),
+    ]
+
+
+def main():
+    if not vectorized.HAVE_NUMPY:
+        print("NumPy is not installed; the pure-Python path is the only engine")
+        sys.exit(2)
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000, 1_000_000]
+    check_dtypes()
+    rng = random.Random(0)
+    print(f"{'case':<24}{'size':>10}{'pure':>12}{'numpy':>12}{'speed-up':>10}")
+    for size in sizes:
+        for name, pure_ns, numpy_ns in compare(size, rng):
+            print(f"{name:<24}{size:>10}{format_ns(pure_ns):>12}{format_ns(numpy_ns):>12}"
+                  f"{pure_ns / numpy_ns:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Contention benchmark: multi-producer/multi-consumer throughput of the concurrent queues.
+
+Pushes the same number of items through BlockingQueue (threads) and
+AsyncQueue (asyncio tasks), next to the standard library's queue.Queue and
+asyncio.Queue, for several producer x consumer mixes and queue bounds.
+
+Run from the repository root:
+    python benchmarks/queue_contention.py [items per producer]
+"""
+import asyncio
+import os
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dsa_hub.concurrency import BlockingQueue, AsyncQueue  # noqa: E402
+
+MIXES = ((1, 1), (4, 4), (8, 2), (2, 8))
+BOUNDS = (0, 64)
+STOP = object()
+
+
+def run_threads(make_queue, put, get, producers, consumers, items):
+    shared = make_queue()
+
+    def produce():
+        for i in range(items):
+            put(shared, i)
+
+    def consume():
+        while get(shared) is not STOP:
+            pass
+
+    workers = [threading.Thread(target=consume) for _ in range(consumers)]
+    feeders = [threading.Thread(target=produce) for _ in range(producers)]
+    start = time.perf_counter()
+    for thread in workers + feeders:
+        thread.start()
+    for thread in feeders:
+        thread.join()
+    for _ in workers:
+        put(shared, STOP)
+    for thread in workers:
+        thread.join()
+    return time.perf_counter() - start
+
+
+async def run_tasks(make_queue, put, get, producers, consumers, items):
+    shared = make_queue()
+
+    async def produce():
+        for i in range(items):
+            await put(shared, i)
+
+    async def consume():
+        while await get(shared) is not STOP:
+            pass
+
+    start = time.perf_counter()
+    workers = [asyncio.ensure_future(consume()) for _ in range(consumers)]
+    await asyncio.gather(*(produce() for _ in range(producers)))
+    for _ in workers:
+        await put(shared, STOP)
+    await asyncio.gather(*workers)
+    return time.perf_counter() - start
+
+
+def main():
+    items = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    cases = [
+        ("BlockingQueue", "threads", lambda bound: BlockingQueue(bound), BlockingQueue.put, BlockingQueue.get),
+        ("queue.Queue", "threads", lambda bound: queue.Queue(bound), queue.Queue.put, queue.Queue.get),
+        ("AsyncQueue", "asyncio", lambda bound: AsyncQueue(bound), AsyncQueue.enqueue, AsyncQueue.dequeue),
+        ("asyncio.Queue", "asyncio", lambda bound: asyncio.Queue(bound), asyncio.Queue.put, asyncio.Queue.get),
+    ]
+    print(f"{'queue':<16}{'producers x consumers':>23}{'bound':>8}{'items/s':>14}")
+    for name, kind, make, put, get in cases:
+        for producers, consumers in MIXES:
+            for bound in BOUNDS:
+                def make_queue():
+                    return make(bound)
+
+                if kind == "threads":
+                    elapsed = run_threads(make_queue, put, get, producers, consumers, items)
+                else:
+                    elapsed = asyncio.run(run_tasks(make_queue, put, get, producers, consumers, items))
+                rate = producers * items / elapsed
+                print(f"{name:<16}{f'{producers} x {consumers}':>23}{bound or '-':>8}{rate:>14,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+"""DSA Learning Hub: data structures and algorithms with an optional Tkinter GUI
+
+Importing the package only loads the core modules. The background worker
+(dsa_hub.worker, which needs threading), the thread/asyncio queues
+(dsa_hub.concurrency) and the Tkinter front end (dsa_hub.gui) are imported
+on demand, so batch jobs never pay for them.
+"""
+from .structures import (
+    Node, ListNode, IndexedListNode, CacheNode, TreeNode, AVLNode,
+    LinkedList, IndexedLinkedList, DoublyLinkedList, LRUCache, Stack, Queue,
+    BLOCK, DROP_OLDEST, REJECT, RingBuffer, BoundedQueue, BoundedStack,
+    HeapEntry, BinaryHeap,
+    BinarySearchTree, AVLTree, ArrayBinarySearchTree,
+)
+from .algorithms import (
+    COMPARE, SWAP, WRITE,
+    SortTrace, SortingAlgorithms, SearchAlgorithms, SortedIndex,
+    measure_ns, format_ns,
+)
+from .instrument import OperationCounter, instrumented
+
+__all__ = [
+    "Node", "ListNode", "IndexedListNode", "CacheNode", "TreeNode", "AVLNode",
+    "LinkedList", "IndexedLinkedList", "DoublyLinkedList", "LRUCache", "Stack", "Queue",
+    "BLOCK", "DROP_OLDEST", "REJECT", "RingBuffer", "BoundedQueue", "BoundedStack",
+    "HeapEntry", "BinaryHeap",
+    "BinarySearchTree", "AVLTree", "ArrayBinarySearchTree",
+    "COMPARE", "SWAP", "WRITE",
+    "SortTrace", "SortingAlgorithms", "SearchAlgorithms", "SortedIndex",
+    "measure_ns", "format_ns",
+    "OperationCounter", "instrumented",
+]
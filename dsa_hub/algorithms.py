@@ -0,0 +1,450 @@
+"""Sorting and searching algorithms with an opt-in step event protocol"""
+import time
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict
+
+
+# Sort events passed to callbacks: (COMPARE, i, j), (SWAP, i, j) or (WRITE, i, value).
+# Indices refer to the array being sorted; replaying SWAP and WRITE events in order on a
+# copy of the input reproduces every intermediate state (see SortTrace). One exception:
+# inside a merge_sort merge, the second COMPARE index is where the left-run element sat
+# before the merge started. The element has been copied to a buffer by then, and that
+# slot may already have been overwritten, so it does not hold the compared value.
+COMPARE = 'compare'
+SWAP = 'swap'
+WRITE = 'write'
+
+
+class SortTrace:
+    """Replays sort events onto a private copy of the input and counts them"""
+
+    def __init__(self, arr, on_step=None):
+        self.array = list(arr)
+        self.on_step = on_step
+        self.comparisons = 0
+        self.swaps = 0
+        self.writes = 0
+        self.event = None  # most recent SWAP or WRITE event
+
+    def __call__(self, event):
+        kind, a, b = event
+        if kind == COMPARE:
+            self.comparisons += 1
+            return
+        if kind == SWAP:
+            self.array[a], self.array[b] = self.array[b], self.array[a]
+            self.swaps += 1
+        else:
+            self.array[a] = b
+            self.writes += 1
+        self.event = event
+        if self.on_step:
+            self.on_step(self)
+
+    @property
+    def steps(self):
+        return self.swaps + self.writes
+
+    def snapshot(self):
+        return self.array.copy()
+
+
+class SortingAlgorithms:
+    """Collection of sorting algorithms
+
+    Every routine takes (arr, callback=None), returns a sorted copy and reports
+    progress as COMPARE/SWAP/WRITE events rather than array copies.
+    """
+
+    INSERTION_THRESHOLD = 16  # quick_sort switches to insertion sort below this size
+    COUNTING_RANGE_FACTOR = 4  # counting_sort uses radix_sort when max - min exceeds this many times n
+
+    @staticmethod
+    def bubble_sort(arr, callback=None):
+        n = len(arr)
+        arr_copy = arr.copy()
+        for i in range(n):
+            for j in range(0, n - i - 1):
+                if callback:
+                    callback((COMPARE, j, j + 1))
+                if arr_copy[j] > arr_copy[j + 1]:
+                    arr_copy[j], arr_copy[j + 1] = arr_copy[j + 1], arr_copy[j]
+                    if callback:
+                        callback((SWAP, j, j + 1))
+        return arr_copy
+
+    @staticmethod
+    def selection_sort(arr, callback=None):
+        n = len(arr)
+        arr_copy = arr.copy()
+        for i in range(n):
+            min_idx = i
+            for j in range(i + 1, n):
+                if callback:
+                    callback((COMPARE, j, min_idx))
+                if arr_copy[j] < arr_copy[min_idx]:
+                    min_idx = j
+            if min_idx != i:
+                arr_copy[i], arr_copy[min_idx] = arr_copy[min_idx], arr_copy[i]
+                if callback:
+                    callback((SWAP, i, min_idx))
+        return arr_copy
+
+    @staticmethod
+    def insertion_sort(arr, callback=None):
+        arr_copy = arr.copy()
+        SortingAlgorithms._insertion_sort_range(arr_copy, 0, len(arr_copy), callback)
+        return arr_copy
+
+    @staticmethod
+    def merge_sort(arr, callback=None):
+        """Stable bottom-up merge sort, O(n log n)"""
+        arr_copy = arr.copy()
+        n = len(arr_copy)
+        width = 1
+        while width < n:
+            for lo in range(0, n - width, 2 * width):
+                mid = lo + width
+                hi = min(mid + width, n)
+                if callback:
+                    callback((COMPARE, mid - 1, mid))
+                if arr_copy[mid - 1] <= arr_copy[mid]:
+                    continue
+                left = arr_copy[lo:mid]
+                i, j, k = 0, mid, lo
+                while i < width and j < hi:
+                    if callback:
+                        # lo + i is left[i]'s slot before the merge, not its current contents
+                        callback((COMPARE, j, lo + i))
+                    if arr_copy[j] < left[i]:
+                        arr_copy[k] = arr_copy[j]
+                        j += 1
+                    else:
+                        arr_copy[k] = left[i]
+                        i += 1
+                    if callback:
+                        callback((WRITE, k, arr_copy[k]))
+                    k += 1
+                arr_copy[k:k + width - i] = left[i:]
+                if callback:
+                    for k in range(k, k + width - i):
+                        callback((WRITE, k, arr_copy[k]))
+            width *= 2
+        return arr_copy
+
+    @staticmethod
+    def heap_sort(arr, callback=None):
+        """In-place heap sort, O(n log n) worst case"""
+        arr_copy = arr.copy()
+        SortingAlgorithms._heap_sort_range(arr_copy, 0, len(arr_copy), callback)
+        return arr_copy
+
+    @staticmethod
+    def quick_sort(arr, callback=None):
+        """Introsort: median-of-three quicksort with heap sort and insertion sort fallbacks"""
+        arr_copy = arr.copy()
+        ranges = [(0, len(arr_copy), 2 * len(arr_copy).bit_length())]
+        while ranges:
+            lo, hi, depth = ranges.pop()
+            if hi - lo <= SortingAlgorithms.INSERTION_THRESHOLD:
+                SortingAlgorithms._insertion_sort_range(arr_copy, lo, hi, callback)
+            elif depth == 0:
+                SortingAlgorithms._heap_sort_range(arr_copy, lo, hi, callback)
+            else:
+                split = SortingAlgorithms._partition(arr_copy, lo, hi, callback)
+                ranges.append((split + 1, hi, depth - 1))
+                ranges.append((lo, split + 1, depth - 1))
+        return arr_copy
+
+    @staticmethod
+    def counting_sort(arr, callback=None):
+        """Counting sort for bounded integers, O(n + k); wide ranges use radix sort"""
+        if not arr:
+            return []
+        lo, hi = min(arr), max(arr)
+        if hi - lo > SortingAlgorithms.COUNTING_RANGE_FACTOR * len(arr) + 1024:
+            return SortingAlgorithms.radix_sort(arr, callback)
+        counts = [0] * (hi - lo + 1)
+        for value in arr:
+            counts[value - lo] += 1
+        arr_copy = arr.copy()
+        pos = 0
+        for offset, count in enumerate(counts):
+            if count:
+                arr_copy[pos:pos + count] = [lo + offset] * count
+                if callback:
+                    for i in range(pos, pos + count):
+                        callback((WRITE, i, lo + offset))
+                pos += count
+        return arr_copy
+
+    @staticmethod
+    def radix_sort(arr, callback=None):
+        """LSD radix sort on bytes for integers, O(n * bytes)"""
+        arr_copy = arr.copy()
+        if not arr_copy:
+            return arr_copy
+        lo = min(arr_copy)
+        max_key = max(arr_copy) - lo
+        shift = 0
+        while max_key >> shift:
+            buckets = [[] for _ in range(256)]
+            for value in arr_copy:
+                buckets[((value - lo) >> shift) & 0xFF].append(value)
+            arr_copy = [value for bucket in buckets for value in bucket]
+            if callback:
+                for i, value in enumerate(arr_copy):
+                    callback((WRITE, i, value))
+            shift += 8
+        return arr_copy
+
+    @staticmethod
+    def _insertion_sort_range(arr, lo, hi, callback=None):
+        # The element being inserted logically sits in the hole at j + 1
+        for i in range(lo + 1, hi):
+            key = arr[i]
+            j = i - 1
+            while j >= lo:
+                if callback:
+                    callback((COMPARE, j + 1, j))
+                if not key < arr[j]:
+                    break
+                arr[j + 1] = arr[j]
+                if callback:
+                    callback((WRITE, j + 1, arr[j]))
+                j -= 1
+            if j + 1 != i:
+                arr[j + 1] = key
+                if callback:
+                    callback((WRITE, j + 1, key))
+
+    @staticmethod
+    def _sift_down(arr, lo, i, size, callback=None):
+        # The sifted item logically sits in the hole at lo + i
+        item = arr[lo + i]
+        start = i
+        while True:
+            child = 2 * i + 1
+            if child >= size:
+                break
+            if child + 1 < size:
+                if callback:
+                    callback((COMPARE, lo + child + 1, lo + child))
+                if arr[lo + child + 1] > arr[lo + child]:
+                    child += 1
+            if callback:
+                callback((COMPARE, lo + child, lo + i))
+            if arr[lo + child] <= item:
+                break
+            arr[lo + i] = arr[lo + child]
+            if callback:
+                callback((WRITE, lo + i, arr[lo + i]))
+            i = child
+        if i != start:
+            arr[lo + i] = item
+            if callback:
+                callback((WRITE, lo + i, item))
+
+    @staticmethod
+    def _heap_sort_range(arr, lo, hi, callback=None):
+        size = hi - lo
+        for i in range(size // 2 - 1, -1, -1):
+            SortingAlgorithms._sift_down(arr, lo, i, size, callback)
+        for end in range(size - 1, 0, -1):
+            arr[lo], arr[lo + end] = arr[lo + end], arr[lo]
+            if callback:
+                callback((SWAP, lo, lo + end))
+            SortingAlgorithms._sift_down(arr, lo, 0, end, callback)
+
+    @staticmethod
+    def _partition(arr, lo, hi, callback=None):
+        """Hoare partition of arr[lo:hi] around the median of first, middle and last"""
+        mid = (lo + hi - 1) // 2
+        last = hi - 1
+        for a, b in ((lo, mid), (lo, last), (mid, last)):
+            if callback:
+                callback((COMPARE, b, a))
+            if arr[b] < arr[a]:
+                arr[a], arr[b] = arr[b], arr[a]
+                if callback:
+                    callback((SWAP, a, b))
+        pivot = arr[mid]
+        pivot_idx = mid
+        i, j = lo - 1, hi
+        while True:
+            while True:
+                i += 1
+                if callback:
+                    callback((COMPARE, i, pivot_idx))
+                if not arr[i] < pivot:
+                    break
+            while True:
+                j -= 1
+                if callback:
+                    callback((COMPARE, j, pivot_idx))
+                if not arr[j] > pivot:
+                    break
+            if i >= j:
+                return j
+            arr[i], arr[j] = arr[j], arr[i]
+            if callback:
+                callback((SWAP, i, j))
+                if pivot_idx in (i, j):
+                    pivot_idx = i + j - pivot_idx
+
+
+class SearchAlgorithms:
+    """Collection of search algorithms, each returning the index of target or -1"""
+
+    @staticmethod
+    def linear_search(arr, target, callback=None):
+        """callback(i) is called before checking index i"""
+        for i, val in enumerate(arr):
+            if callback:
+                callback(i)
+            if val == target:
+                return i
+        return -1
+
+    @staticmethod
+    def binary_search(sorted_arr, target, callback=None):
+        """callback(left, mid, right) is called before probing mid"""
+        left, right = 0, len(sorted_arr) - 1
+        while left <= right:
+            mid = (left + right) // 2
+            if callback:
+                callback(left, mid, right)
+            mid_val = sorted_arr[mid]
+            if mid_val == target:
+                return mid
+            if mid_val < target:
+                left = mid + 1
+            else:
+                right = mid - 1
+        return -1
+
+
+class SortedIndex:
+    """A sorted copy of an array, built once and reused for any number of searches
+
+    Indices returned by the queries refer to the sorted values; positions[i]
+    is where values[i] sat in the original array. With duplicate keys search()
+    reports the leftmost one.
+    """
+
+    CACHE_SIZE = 8
+    MERGE_RATIO = 8  # A sorted batch of at least len / MERGE_RATIO targets is merged, not bisected
+    _cache = OrderedDict()
+
+    def __init__(self, arr):
+        self.positions = sorted(range(len(arr)), key=arr.__getitem__)
+        self.values = [arr[i] for i in self.positions]
+
+    @classmethod
+    def of(cls, arr):
+        """Return the index for arr's current contents, reusing a cached one when possible"""
+        key = tuple(arr)
+        index = cls._cache.get(key)
+        if index is None:
+            index = cls._cache[key] = cls(arr)
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        else:
+            cls._cache.move_to_end(key)
+        return index
+
+    @classmethod
+    def clear_cache(cls):
+        cls._cache.clear()
+
+    def __len__(self):
+        return len(self.values)
+
+    def lower_bound(self, target):
+        """Position of the first value >= target"""
+        return bisect_left(self.values, target)
+
+    def upper_bound(self, target):
+        """Position of the first value > target"""
+        return bisect_right(self.values, target)
+
+    def search(self, target):
+        i = bisect_left(self.values, target)
+        return i if i < len(self.values) and self.values[i] == target else -1
+
+    def search_many(self, targets):
+        """search() for every target; a sorted batch is answered in one merge-style pass"""
+        targets = list(targets)
+        if any(b < a for a, b in zip(targets, targets[1:])):
+            return [self.search(target) for target in targets]
+
+        values = self.values
+        size = len(values)
+        results = []
+        cursor = 0
+        # Targets only grow, so nothing left of the cursor needs looking at again
+        if len(targets) * self.MERGE_RATIO >= size:
+            for target in targets:
+                while cursor < size and values[cursor] < target:
+                    cursor += 1
+                results.append(cursor if cursor < size and values[cursor] == target else -1)
+        else:
+            for target in targets:
+                cursor = bisect_left(values, target, cursor)
+                results.append(cursor if cursor < size and values[cursor] == target else -1)
+        return results
+
+    def count(self, target):
+        return self.upper_bound(target) - self.lower_bound(target)
+
+    def count_range(self, lo, hi):
+        """Number of values in [lo, hi]"""
+        if hi < lo:
+            return 0
+        return self.upper_bound(hi) - self.lower_bound(lo)
+
+    def range(self, lo, hi):
+        """Values in [lo, hi], in sorted order"""
+        return self.values[self.lower_bound(lo):self.upper_bound(hi)]
+
+
+def measure_ns(function, *args, min_total_ns=20_000_000, max_repeats=1000):
+    """Best-of-N wall time of function(*args) in ns, repeating short calls for stable numbers"""
+    best = None
+    total = 0
+    repeats = 0
+    while repeats < max_repeats and (total < min_total_ns or repeats == 0):
+        start = time.perf_counter_ns()
+        function(*args)
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+        total += elapsed
+        repeats += 1
+    return best
+
+
+def format_ns(ns):
+    if ns < 1_000:
+        return f"{ns} ns"
+    if ns < 1_000_000:
+        return f"{ns / 1_000:.1f} µs"
+    if ns < 1_000_000_000:
+        return f"{ns / 1_000_000:.2f} ms"
+    return f"{ns / 1_000_000_000:.3f} s"
+
+
+SORT_COMPLEXITY = {
+    "bubble": "O(n²) average case",
+    "selection": "O(n²) average case",
+    "insertion": "O(n²) average case",
+    "merge": "O(n log n) worst case",
+    "heap": "O(n log n) worst case",
+    "quick": "O(n log n) worst case (introsort)",
+    "counting": "O(n + k), k = value range",
+    "radix": "O(n · d), d = key bytes",
+}
+
+SEARCH_COMPLEXITY = {
+    "linear": "O(n)",
+    "binary": "O(log n)",
+}
@@ -0,0 +1,467 @@
+"""Headless benchmark suite for the DSA Learning Hub data structures and algorithms.
+
+Runs every structure operation and every SortingAlgorithms routine across the
+requested sizes and input distributions and reports ops/sec, ns/op and peak
+memory as JSON or CSV, so results can be compared between versions. For
+whole-array operations (sorts, reverse) an "op" is one element.
+
+    python -m dsa_hub.bench --sizes 1000,10000 --format csv --output bench.csv
+"""
+import argparse
+import csv
+import heapq
+import json
+import random
+import sys
+import time
+import tracemalloc
+
+from .structures import (
+    LinkedList, IndexedLinkedList, DoublyLinkedList, LRUCache, Stack, Queue, BoundedQueue, BoundedStack,
+    DROP_OLDEST, BinaryHeap, BinarySearchTree, AVLTree
+)
+from .algorithms import SortingAlgorithms, SortedIndex
+from . import vectorized
+
+DISTRIBUTIONS = ("random", "sorted", "reversed", "few-unique")
+# Inputs that make a case quadratic; these are skipped above --max-quadratic-size
+ALL = frozenset(DISTRIBUTIONS)
+DEGENERATE_BST = frozenset(("sorted", "reversed", "few-unique"))
+
+
+def make_input(distribution, size, rng):
+    if distribution == "random":
+        return [rng.randrange(size * 10 + 1) for _ in range(size)]
+    if distribution == "sorted":
+        return list(range(size))
+    if distribution == "reversed":
+        return list(range(size, 0, -1))
+    if distribution == "few-unique":
+        return [rng.randrange(8) for _ in range(size)]
+    raise ValueError(f"unknown distribution: {distribution}")
+
+
+# Each setup(data) prepares untimed state and returns (run, operation count)
+
+def linked_list_append(list_class):
+    def setup(data):
+        def run():
+            linked_list = list_class()
+            for value in data:
+                linked_list.append(value)
+        return run, len(data)
+    return setup
+
+
+def linked_list_prepend(data):
+    def run():
+        linked_list = LinkedList()
+        for value in data:
+            linked_list.prepend(value)
+    return run, len(data)
+
+
+def linked_list_extend(data):
+    def run():
+        LinkedList().extend(data)
+    return run, len(data)
+
+
+def linked_list_iterate(data):
+    linked_list = LinkedList()
+    linked_list.extend(data)
+
+    def run():
+        for _ in linked_list:
+            pass
+    return run, len(data)
+
+
+def linked_list_delete(list_class):
+    def setup(data):
+        linked_list = list_class()
+        linked_list.extend(data)
+        targets = data[-1:-101:-1]  # Values near the tail: worst case for the scan
+
+        def run():
+            for value in targets:
+                linked_list.delete(value)
+        return run, len(targets)
+    return setup
+
+
+def linked_list_contains(list_class):
+    def setup(data):
+        linked_list = list_class()
+        linked_list.extend(data)
+        targets = data[-1:-101:-1]
+
+        def run():
+            for value in targets:
+                linked_list.contains(value)
+        return run, len(targets)
+    return setup
+
+
+def linked_list_reverse(data):
+    linked_list = LinkedList()
+    linked_list.extend(data)
+    return linked_list.reverse, len(data)
+
+
+def doubly_linked_move_to_front(data):
+    linked_list = DoublyLinkedList()
+    nodes = [linked_list.append(value) for value in data]
+
+    def run():
+        for node in reversed(nodes):
+            linked_list.move_to_front(node)
+    return run, len(nodes)
+
+
+def lru_cache_lookups(data):
+    def run():
+        # A cache a tenth the size of the key space: a realistic mix of hits, misses and evictions
+        cache = LRUCache(len(data) // 10 + 1)
+        for value in data:
+            if cache.get(value) is None:
+                cache.put(value, value)
+    return run, len(data)
+
+
+def stack_push(data):
+    def run():
+        stack = Stack()
+        for value in data:
+            stack.push(value)
+    return run, len(data)
+
+
+def stack_pop(data):
+    stack = Stack()
+    for value in data:
+        stack.push(value)
+
+    def run():
+        while stack.pop() is not None:
+            pass
+    return run, len(data)
+
+
+def queue_enqueue(data):
+    def run():
+        queue = Queue()
+        for value in data:
+            queue.enqueue(value)
+    return run, len(data)
+
+
+def queue_dequeue(data):
+    queue = Queue()
+    for value in data:
+        queue.enqueue(value)
+
+    def run():
+        while queue.dequeue() is not None:
+            pass
+    return run, len(data)
+
+
+def bounded_queue_enqueue(typecode=None):
+    def setup(data):
+        def run():
+            queue = BoundedQueue(len(data), typecode=typecode)
+            for value in data:
+                queue.enqueue(value)
+        return run, len(data)
+    return setup
+
+
+def bounded_queue_dequeue(typecode=None):
+    def setup(data):
+        queue = BoundedQueue(len(data), typecode=typecode)
+        queue.enqueue_many(data)
+
+        def run():
+            while queue.dequeue() is not None:
+                pass
+        return run, len(data)
+    return setup
+
+
+def bounded_queue_batch(typecode=None):
+    def setup(data):
+        def run():
+            queue = BoundedQueue(len(data), typecode=typecode)
+            queue.enqueue_many(data)
+            queue.dequeue_many(len(data))
+        return run, len(data)
+    return setup
+
+
+def bounded_queue_drop_oldest(data):
+    def run():
+        # Producer burst into a small buffer: nearly every enqueue overwrites the oldest item
+        queue = BoundedQueue(1024, DROP_OLDEST)
+        for value in data:
+            queue.enqueue(value)
+    return run, len(data)
+
+
+def bounded_stack_push_pop(data):
+    def run():
+        stack = BoundedStack(len(data))
+        for value in data:
+            stack.push(value)
+        while stack.pop() is not None:
+            pass
+    return run, len(data)
+
+
+def stack_push_pop(data):
+    def run():
+        stack = Stack()
+        for value in data:
+            stack.push(value)
+        while stack.pop() is not None:
+            pass
+    return run, len(data)
+
+
+def heap_push_pop(arity):
+    def setup(data):
+        def run():
+            heap = BinaryHeap(arity)
+            for value in data:
+                heap.push(value)
+            while heap.pop() is not None:
+                pass
+        return run, len(data)
+    return setup
+
+
+def heapq_push_pop(data):
+    def run():
+        heap = []
+        for value in data:
+            heapq.heappush(heap, value)
+        while heap:
+            heapq.heappop(heap)
+    return run, len(data)
+
+
+def heap_heapify(data):
+    return (lambda: BinaryHeap.heapify(data)), len(data)
+
+
+def heapq_heapify(data):
+    return (lambda: heapq.heapify(list(data))), len(data)
+
+
+def heap_decrease_key(data):
+    heap = BinaryHeap.heapify(data)
+    entries = list(heap.entries)
+    shift = len(data) * 10 + 1
+
+    def run():
+        # Every key drops below all current ones, so each call sifts the full path to the root
+        for entry in entries:
+            heap.decrease_key(entry, entry.key - shift)
+    return run, len(entries)
+
+
+def tree_insert(tree_class):
+    def setup(data):
+        def run():
+            tree = tree_class()
+            for value in data:
+                tree.insert(value)
+        return run, len(data)
+    return setup
+
+
+def tree_search(tree_class):
+    def setup(data):
+        tree = tree_class()
+        for value in data:
+            tree.insert(value)
+
+        def run():
+            for value in data:
+                tree.search(value)
+        return run, len(data)
+    return setup
+
+
+def sort_case(sort_function):
+    def setup(data):
+        return (lambda: sort_function(data)), len(data)
+    return setup
+
+
+def sorted_index_search(sort_targets):
+    def setup(data):
+        index = SortedIndex(data)
+        targets = sorted(data) if sort_targets else data
+        return (lambda: index.search_many(targets)), len(targets)
+    return setup
+
+
+def vectorized_batch_search(data):
+    sorted_values = vectorized.as_array(sorted(data))
+    return (lambda: vectorized.batch_binary_search(sorted_values, data)), len(data)
+
+
+def build_cases():
+    """Return (name, setup, quadratic distributions) for every benchmarked operation"""
+    cases = [
+        ("LinkedList.append", linked_list_append(LinkedList), frozenset()),
+        ("LinkedList.prepend", linked_list_prepend, frozenset()),
+        ("LinkedList.extend", linked_list_extend, frozenset()),
+        ("LinkedList.iterate", linked_list_iterate, frozenset()),
+        ("LinkedList.delete", linked_list_delete(LinkedList), frozenset()),
+        ("LinkedList.contains", linked_list_contains(LinkedList), frozenset()),
+        ("LinkedList.reverse", linked_list_reverse, frozenset()),
+        ("IndexedLinkedList.append", linked_list_append(IndexedLinkedList), frozenset()),
+        ("IndexedLinkedList.delete", linked_list_delete(IndexedLinkedList), frozenset()),
+        ("IndexedLinkedList.contains", linked_list_contains(IndexedLinkedList), frozenset()),
+        ("DoublyLinkedList.move_to_front", doubly_linked_move_to_front, frozenset()),
+        ("LRUCache.get_or_put", lru_cache_lookups, frozenset()),
+        ("Stack.push", stack_push, frozenset()),
+        ("Stack.pop", stack_pop, frozenset()),
+        ("Queue.enqueue", queue_enqueue, frozenset()),
+        ("Queue.dequeue", queue_dequeue, frozenset()),
+        ("BoundedQueue.enqueue", bounded_queue_enqueue(), frozenset()),
+        ("BoundedQueue.dequeue", bounded_queue_dequeue(), frozenset()),
+        ("BoundedQueue.enqueue_many+dequeue_many", bounded_queue_batch(), frozenset()),
+        ("BoundedQueue[q].enqueue", bounded_queue_enqueue('q'), frozenset()),
+        ("BoundedQueue[q].dequeue", bounded_queue_dequeue('q'), frozenset()),
+        ("BoundedQueue[q].enqueue_many+dequeue_many", bounded_queue_batch('q'), frozenset()),
+        ("BoundedQueue.enqueue.drop_oldest", bounded_queue_drop_oldest, frozenset()),
+        ("BinaryHeap.push+pop", heap_push_pop(2), frozenset()),
+        ("BinaryHeap[4-ary].push+pop", heap_push_pop(4), frozenset()),
+        ("heapq.heappush+heappop", heapq_push_pop, frozenset()),
+        ("BinaryHeap.heapify", heap_heapify, frozenset()),
+        ("heapq.heapify", heapq_heapify, frozenset()),
+        ("BinaryHeap.decrease_key", heap_decrease_key, frozenset()),
+        ("Stack.push+pop", stack_push_pop, frozenset()),
+        ("BoundedStack.push+pop", bounded_stack_push_pop, frozenset()),
+        ("BinarySearchTree.insert", tree_insert(BinarySearchTree), DEGENERATE_BST),
+        ("BinarySearchTree.search", tree_search(BinarySearchTree), DEGENERATE_BST),
+        ("AVLTree.insert", tree_insert(AVLTree), frozenset()),
+        ("AVLTree.search", tree_search(AVLTree), frozenset()),
+        ("SortedIndex.search_many", sorted_index_search(False), frozenset()),
+        ("SortedIndex.search_many.sorted_targets", sorted_index_search(True), frozenset()),
+    ]
+    for name in sorted(dir(SortingAlgorithms)):
+        if name.endswith("_sort") and not name.startswith("_"):
+            quadratic = ALL if name in ("bubble_sort", "selection_sort", "insertion_sort") else frozenset()
+            cases.append((f"SortingAlgorithms.{name}", sort_case(getattr(SortingAlgorithms, name)), quadratic))
+    if vectorized.HAVE_NUMPY:
+        cases.append(("vectorized.sort", sort_case(vectorized.sort), frozenset()))
+        cases.append(("vectorized.batch_binary_search", vectorized_batch_search, frozenset()))
+    return cases
+
+
+def measure(setup, data, repeat, trace_memory=True):
+    """Best-of-repeat time and peak traced memory (None when not traced) for one case"""
+    best_ns = None
+    for _ in range(repeat):
+        run, ops = setup(data)
+        start = time.perf_counter_ns()
+        run()
+        elapsed = time.perf_counter_ns() - start
+        best_ns = elapsed if best_ns is None else min(best_ns, elapsed)
+
+    if not trace_memory:
+        return best_ns, ops, None
+
+    # Memory is measured in its own pass because tracing slows everything down
+    run, ops = setup(data)
+    tracemalloc.start()
+    try:
+        run()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return best_ns, ops, peak_bytes
+
+
+def run_benchmarks(sizes, distributions, pattern=None, repeat=3, max_quadratic_size=2000, seed=0,
+                   trace_memory=True):
+    records = []
+    for name, setup, quadratic in build_cases():
+        if pattern and pattern.lower() not in name.lower():
+            continue
+        for distribution in distributions:
+            for size in sizes:
+                record = {"case": name, "distribution": distribution, "size": size}
+                if distribution in quadratic and size > max_quadratic_size:
+                    record["skipped"] = "quadratic input above --max-quadratic-size"
+                    records.append(record)
+                    continue
+                data = make_input(distribution, size, random.Random(seed))
+                elapsed_ns, ops, peak_bytes = measure(setup, data, repeat, trace_memory)
+                record.update({
+                    "ops": ops,
+                    "seconds": elapsed_ns / 1e9,
+                    "ns_per_op": elapsed_ns / ops if ops else 0.0,
+                    "ops_per_sec": ops * 1e9 / elapsed_ns if elapsed_ns else 0.0,
+                    "peak_bytes": peak_bytes,
+                })
+                records.append(record)
+    return records
+
+
+FIELDS = ("case", "distribution", "size", "ops", "seconds", "ns_per_op", "ops_per_sec", "peak_bytes", "skipped")
+
+
+def write_records(records, output_format, stream):
+    if output_format == "csv":
+        writer = csv.DictWriter(stream, fieldnames=FIELDS)
+        writer.writeheader()
+        writer.writerows(records)
+    else:
+        json.dump({"python": sys.version.split()[0], "results": records}, stream, indent=2)
+        stream.write("\n")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m dsa_hub.bench", description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000",
+                        help="comma-separated input sizes (default: 1000,10000)")
+    parser.add_argument("--distributions", default=",".join(DISTRIBUTIONS),
+                        help=f"comma-separated subset of {', '.join(DISTRIBUTIONS)}")
+    parser.add_argument("--only", metavar="PATTERN",
+                        help="run only cases whose name contains PATTERN, e.g. 'sort' or 'LinkedList'")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case; the best is kept")
+    parser.add_argument("--max-quadratic-size", type=int, default=2000,
+                        help="skip O(n^2) case/input combinations above this size")
+    parser.add_argument("--no-memory", dest="trace_memory", action="store_false",
+                        help="skip the tracemalloc pass (it is slow for the O(n^2) sorts)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for random inputs")
+    parser.add_argument("--format", choices=("json", "csv"), default="json")
+    parser.add_argument("--output", help="write results to this file instead of stdout")
+    args = parser.parse_args(argv)
+
+    args.sizes = [int(size) for size in args.sizes.split(",") if size]
+    args.distributions = [name for name in args.distributions.split(",") if name]
+    unknown = set(args.distributions) - set(DISTRIBUTIONS)
+    if unknown:
+        parser.error(f"unknown distribution(s): {', '.join(sorted(unknown))}")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    records = run_benchmarks(args.sizes, args.distributions, args.only, args.repeat,
+                             args.max_quadratic_size, args.seed, args.trace_memory)
+    if args.output:
+        with open(args.output, 'w', newline='', encoding='utf-8') as stream:
+            write_records(records, args.format, stream)
+    else:
+        write_records(records, args.format, sys.stdout)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,228 @@
+"""Empirical growth-rate analysis for the sorting and searching algorithms
+
+Runs an algorithm over a geometric range of input sizes, measures wall time
+(uninstrumented, via measure_ns) and operation counts (comparisons + moves,
+via OperationCounter), and fits both series against the usual complexity
+classes. The class whose scaled curve explains the measurements with the
+smallest relative error wins; confidence says how far ahead of the runner-up
+it is.
+
+    python -m dsa_hub.complexity quick bubble binary --stop 8192
+"""
+import argparse
+import json
+import math
+import random
+import sys
+import time
+
+from .algorithms import SortingAlgorithms, SearchAlgorithms, SORT_COMPLEXITY, SEARCH_COMPLEXITY, measure_ns
+from .instrument import OperationCounter
+
+COMPLEXITY_CLASSES = (
+    ("O(1)", lambda n: 1.0),
+    ("O(log n)", lambda n: math.log2(n)),
+    ("O(n)", lambda n: float(n)),
+    ("O(n log n)", lambda n: n * math.log2(n)),
+    ("O(n²)", lambda n: float(n) * n),
+    ("O(n³)", lambda n: float(n) * n * n),
+)
+
+
+class GrowthFit:
+    """Best-matching complexity class for one series of (size, cost) measurements"""
+
+    def __init__(self, label, confidence, exponent, errors):
+        self.label = label
+        self.confidence = confidence
+        self.exponent = exponent
+        self.errors = errors
+
+    def describe(self):
+        return f"{self.label} (confidence {self.confidence:.0%}, log-log slope {self.exponent:.2f})"
+
+    def as_dict(self):
+        return {"class": self.label, "confidence": self.confidence, "exponent": self.exponent,
+                "errors": self.errors}
+
+
+def fit_growth(sizes, costs):
+    """Fit cost ≈ c·f(n) for every complexity class and return the GrowthFit of the best one"""
+    if len(sizes) < 3:
+        raise ValueError("need measurements at three or more sizes")
+    errors = {}
+    for label, curve in COMPLEXITY_CLASSES:
+        # Least squares on relative error, so the small sizes weigh as much as the large ones
+        ratios = [curve(n) / max(cost, 1) for n, cost in zip(sizes, costs)]
+        scale = sum(ratios) / sum(r * r for r in ratios)
+        residuals = [scale * r - 1 for r in ratios]
+        errors[label] = math.sqrt(sum(r * r for r in residuals) / len(residuals))
+
+    ranked = sorted(errors, key=errors.get)
+    best, runner_up = ranked[0], ranked[1]
+    confidence = 1 - errors[best] / errors[runner_up] if errors[runner_up] else 0.0
+
+    logs_n = [math.log(n) for n in sizes]
+    logs_cost = [math.log(max(cost, 1)) for cost in costs]
+    mean_n = sum(logs_n) / len(logs_n)
+    mean_cost = sum(logs_cost) / len(logs_cost)
+    spread = sum((x - mean_n) ** 2 for x in logs_n)
+    exponent = sum((x - mean_n) * (y - mean_cost) for x, y in zip(logs_n, logs_cost)) / spread
+
+    return GrowthFit(best, confidence, exponent, errors)
+
+
+def geometric_sizes(start=64, stop=16384, factor=2):
+    sizes = []
+    size = start
+    while size <= stop:
+        sizes.append(size)
+        size *= factor
+    return sizes
+
+
+class ComplexityReport:
+    """Measurements of one algorithm across sizes and the growth fitted to them"""
+
+    def __init__(self, name, expected, sizes, times_ns, operations):
+        self.name = name
+        self.expected = expected
+        self.sizes = sizes
+        self.times_ns = times_ns
+        self.operations = operations
+        self.time_fit = fit_growth(sizes, times_ns)
+        self.operation_fit = fit_growth(sizes, operations)
+
+    def describe(self):
+        lines = [f"{'n':>8}  {'time (ns)':>12}  {'operations':>12}"]
+        for size, elapsed, ops in zip(self.sizes, self.times_ns, self.operations):
+            lines.append(f"{size:>8}  {elapsed:>12}  {ops:>12}")
+        lines.append(f"Empirical growth (time): {self.time_fit.describe()}")
+        lines.append(f"Empirical growth (operations): {self.operation_fit.describe()}")
+        lines.append(f"Expected: {self.expected}")
+        return "\n".join(lines)
+
+    def as_dict(self):
+        return {"algorithm": self.name, "expected": self.expected, "sizes": self.sizes,
+                "times_ns": self.times_ns, "operations": self.operations,
+                "time_fit": self.time_fit.as_dict(), "operation_fit": self.operation_fit.as_dict()}
+
+
+def analyze(setup, sizes, name="", expected="", time_budget_ns=2_000_000_000, check=None):
+    """Measure setup(n) -> (run, count_operations) at each size and fit the growth
+
+    run() is timed uninstrumented; count_operations() reruns it with counting
+    and returns the operation total. Sizes past the first three are dropped
+    once the next one would likely overrun time_budget_ns, judged by what the
+    whole previous size cost (setup, timing and the counting rerun); check()
+    is called between sizes so callers can cancel.
+    """
+    measured_sizes, times_ns, operations = [], [], []
+    started = time.perf_counter_ns()
+    step_ns = 0
+    for size in sizes:
+        if check:
+            check()
+        if len(measured_sizes) >= 3:
+            # Assume up to quadratic growth when predicting the next size's cost
+            projected = step_ns * (size / measured_sizes[-1]) ** 2
+            if time.perf_counter_ns() - started + projected > time_budget_ns:
+                break
+        step_started = time.perf_counter_ns()
+        run, count_operations = setup(size)
+        times_ns.append(max(measure_ns(run, min_total_ns=5_000_000), 1))
+        operations.append(count_operations())
+        measured_sizes.append(size)
+        step_ns = time.perf_counter_ns() - step_started
+    return ComplexityReport(name, expected, measured_sizes, times_ns, operations)
+
+
+def sort_setup(algorithm, seed=0):
+    sort_function = getattr(SortingAlgorithms, f"{algorithm}_sort")
+
+    def setup(size):
+        rng = random.Random(seed)
+        data = [rng.randrange(size * 4) for _ in range(size)]
+
+        def count_operations():
+            counter = OperationCounter()
+            sort_function(data, counter.sort_callback())
+            return counter.comparisons + counter.moves
+        return (lambda: sort_function(data)), count_operations
+    return setup
+
+
+def search_setup(algorithm):
+    search_function = getattr(SearchAlgorithms, f"{algorithm}_search")
+
+    def setup(size):
+        # Worst case: the target is absent, so every search runs to the end
+        data = list(range(0, size * 2, 2))
+
+        def count_operations():
+            counter = OperationCounter()
+            search_function(data, -1, counter.probe_callback())
+            return counter.comparisons
+        return (lambda: search_function(data, -1)), count_operations
+    return setup
+
+
+def analyze_sort(algorithm, sizes=None, seed=0, **kwargs):
+    sizes = sizes or geometric_sizes(64, 16384)
+    return analyze(sort_setup(algorithm, seed), sizes, f"{algorithm} sort",
+                   SORT_COMPLEXITY[algorithm], **kwargs)
+
+
+def analyze_search(algorithm, sizes=None, **kwargs):
+    sizes = sizes or geometric_sizes(64, 1 << 18)
+    return analyze(search_setup(algorithm), sizes, f"{algorithm} search",
+                   SEARCH_COMPLEXITY[algorithm], **kwargs)
+
+
+def parse_args(argv=None):
+    algorithms = sorted(SORT_COMPLEXITY) + sorted(SEARCH_COMPLEXITY)
+    parser = argparse.ArgumentParser(prog="python -m dsa_hub.complexity", description=__doc__.splitlines()[0])
+    parser.add_argument("algorithms", nargs="*", default=algorithms, metavar="ALGORITHM",
+                        help=f"any of {', '.join(algorithms)} (default: all)")
+    parser.add_argument("--start", type=int, default=64, help="smallest input size (default: 64)")
+    parser.add_argument("--stop", type=int, help="largest input size (default: 16384 for sorts, 262144 for searches)")
+    parser.add_argument("--budget", type=float, default=2.0,
+                        help="seconds per algorithm before larger sizes are skipped (default: 2)")
+    parser.add_argument("--seed", type=int, default=0, help="seed for random sort inputs")
+    parser.add_argument("--format", choices=("text", "json"), default="text")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.algorithms) - set(algorithms)
+    if unknown:
+        parser.error(f"unknown algorithm(s): {', '.join(sorted(unknown))}")
+    if args.start < 1:
+        parser.error("--start must be at least 1")
+    for complexity, default_stop in ((SORT_COMPLEXITY, 16384), (SEARCH_COMPLEXITY, 1 << 18)):
+        if any(algorithm in complexity for algorithm in args.algorithms):
+            if len(geometric_sizes(args.start, args.stop or default_stop)) < 3:
+                parser.error(f"--start {args.start} to --stop {args.stop or default_stop} gives fewer than "
+                             f"3 doubling sizes; a growth fit needs at least 3")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    budget_ns = int(args.budget * 1e9)
+    reports = []
+    for algorithm in args.algorithms:
+        if algorithm in SORT_COMPLEXITY:
+            sizes = geometric_sizes(args.start, args.stop or 16384)
+            report = analyze_sort(algorithm, sizes, args.seed, time_budget_ns=budget_ns)
+        else:
+            sizes = geometric_sizes(args.start, args.stop or 1 << 18)
+            report = analyze_search(algorithm, sizes, time_budget_ns=budget_ns)
+        reports.append(report)
+        if args.format == "text":
+            print(f"=== {report.name} ===\n{report.describe()}\n", flush=True)
+    if args.format == "json":
+        json.dump([report.as_dict() for report in reports], sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
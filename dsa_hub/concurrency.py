@@ -0,0 +1,161 @@
+"""Queue variants for sharing work between threads or asyncio tasks
+
+Both keep Queue's enqueue/dequeue/front/size/display API on top of the same
+deque. BlockingQueue adds blocking put()/get() with timeouts for threads;
+AsyncQueue makes enqueue()/dequeue() awaitable for coroutines. Neither is
+imported by the dsa_hub package itself, so the core import stays free of
+threading and asyncio.
+"""
+import asyncio
+import threading
+from collections import deque
+from queue import Empty, Full
+
+from .structures import Queue
+
+
+class BlockingQueue(Queue):
+    """Thread-safe FIFO queue with condition-variable wakeups
+
+    maxsize 0 means unbounded. enqueue() is put() (it blocks while a bounded
+    queue is full) and dequeue() keeps Queue's non-blocking behaviour,
+    returning None when empty; get() is the blocking counterpart. put() and
+    get() raise queue.Full / queue.Empty when their timeout runs out.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__()
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def _has_room(self):
+        return not self.maxsize or len(self.items) < self.maxsize
+
+    def _has_items(self):
+        return bool(self.items)
+
+    def put(self, item, timeout=None):
+        with self.not_full:
+            if not self._has_room() and not self.not_full.wait_for(self._has_room, timeout):
+                raise Full
+            self.items.append(item)
+            self.not_empty.notify()
+
+    def get(self, timeout=None):
+        with self.not_empty:
+            if not self.items and not self.not_empty.wait_for(self._has_items, timeout):
+                raise Empty
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+
+    def enqueue(self, item):
+        self.put(item)
+
+    def dequeue(self):
+        with self.lock:
+            if not self.items:
+                return None
+            item = self.items.popleft()
+            self.not_full.notify()
+            return item
+
+    def front(self):
+        with self.lock:
+            return super().front()
+
+    def rear(self):
+        with self.lock:
+            return super().rear()
+
+    def display(self):
+        with self.lock:
+            return super().display()
+
+    def peek_range(self, start, count):
+        with self.lock:
+            return super().peek_range(start, count)
+
+
+class AsyncQueue(Queue):
+    """FIFO queue for asyncio tasks: await enqueue() / await dequeue()
+
+    maxsize 0 means unbounded. dequeue() waits for an item and enqueue()
+    waits for room in a bounded queue; put()/get() do the same with a
+    timeout, raising TimeoutError when it runs out. enqueue_nowait() and
+    dequeue_nowait() never wait (the latter keeps Queue's None-when-empty
+    behaviour) and may be called from plain callbacks on the loop. Waiting
+    tasks park on futures that are resolved one at a time, so a new item
+    wakes a single consumer. Use one instance per event loop.
+    """
+
+    def __init__(self, maxsize=0):
+        super().__init__()
+        self.maxsize = maxsize
+        self.getters = deque()
+        self.putters = deque()
+
+    def _has_room(self):
+        return not self.maxsize or len(self.items) < self.maxsize
+
+    @staticmethod
+    def _wake_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _wait(self, waiters, ready):
+        while not ready():
+            waiter = asyncio.get_running_loop().create_future()
+            waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                if waiter in waiters:
+                    waiters.remove(waiter)
+                elif ready():
+                    # This task was woken but can no longer use the slot; pass it on
+                    self._wake_next(waiters)
+                raise
+
+    def _has_items(self):
+        return bool(self.items)
+
+    async def enqueue(self, item):
+        if not self._has_room():
+            await self._wait(self.putters, self._has_room)
+        self.items.append(item)
+        self._wake_next(self.getters)
+
+    async def dequeue(self):
+        if not self.items:
+            await self._wait(self.getters, self._has_items)
+        item = self.items.popleft()
+        self._wake_next(self.putters)
+        return item
+
+    async def put(self, item, timeout=None):
+        await asyncio.wait_for(self.enqueue(item), timeout)
+
+    async def get(self, timeout=None):
+        return await asyncio.wait_for(self.dequeue(), timeout)
+
+    def enqueue_nowait(self, item):
+        """Append without waiting; returns False if a bounded queue is full"""
+        if not self._has_room():
+            return False
+        self.items.append(item)
+        self._wake_next(self.getters)
+        return True
+
+    def dequeue_nowait(self):
+        if not self.items:
+            return None
+        item = self.items.popleft()
+        self._wake_next(self.putters)
+        return item
@@ -0,0 +1,314 @@
+"""Opt-in operation counting for the core structures and algorithms
+
+Nothing here runs unless asked for. OperationCounter.sort_callback() and
+probe_callback() count through the existing callback hooks, and the
+instrumented() context manager swaps counting versions of the
+LinkedList/IndexedLinkedList, BinarySearchTree/AVLTree, SortingAlgorithms and SearchAlgorithms methods in
+for the duration of a with block, restoring the plain ones on exit:
+
+    with instrumented() as counts:
+        tree.insert(42)
+        SortingAlgorithms.quick_sort(data)
+    print(counts.as_dict())
+
+The patches are process-wide, so other threads running the same classes
+inside the block are counted too.
+"""
+from contextlib import contextmanager
+from functools import wraps
+
+from .structures import LinkedList, IndexedLinkedList, BinarySearchTree, AVLTree
+from .algorithms import COMPARE, SWAP, SortingAlgorithms, SearchAlgorithms
+
+
+class OperationCounter:
+    """Tallies of the work done by instrumented operations
+
+    comparisons  key/element comparisons
+    moves        element writes into arrays (a swap is two) and node relinks
+    traversals   steps from one node to another
+    allocations  nodes or result lists created
+    """
+
+    FIELDS = ('comparisons', 'moves', 'traversals', 'allocations')
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.comparisons = 0
+        self.moves = 0
+        self.traversals = 0
+        self.allocations = 0
+
+    def as_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    def summary(self):
+        return ", ".join(f"{field}={value}" for field, value in self.as_dict().items())
+
+    def __repr__(self):
+        return f"OperationCounter({self.summary()})"
+
+    def sort_callback(self, inner=None):
+        """A sort callback that counts events, then forwards them to inner"""
+        return _SortEventCounter(self, inner)
+
+    def probe_callback(self, inner=None):
+        """A search callback that counts each probe as a comparison, then forwards to inner"""
+        def callback(*args):
+            self.comparisons += 1
+            if inner:
+                inner(*args)
+        return callback
+
+
+class _SortEventCounter:
+    __slots__ = ('counter', 'inner')
+
+    def __init__(self, counter, inner):
+        self.counter = counter
+        self.inner = inner
+
+    def __call__(self, event):
+        kind = event[0]
+        if kind == COMPARE:
+            self.counter.comparisons += 1
+        elif kind == SWAP:
+            self.counter.moves += 2
+        else:
+            self.counter.moves += 1
+        if self.inner:
+            self.inner(event)
+
+
+_active = None  # counter of the running instrumented() block
+
+
+# Counting replacements, installed only inside instrumented()
+
+def _counting_append(original):
+    @wraps(original)
+    def append(self, data):
+        _active.allocations += 1
+        original(self, data)
+    return append
+
+
+def _counting_extend(original):
+    @wraps(original)
+    def extend(self, iterable):
+        before = self.length
+        allocations = _active.allocations
+        original(self, iterable)
+        # One per node, even when extend() links them through a counting append()
+        _active.allocations = allocations + self.length - before
+    return extend
+
+
+def _counting_reverse(original):
+    @wraps(original)
+    def reverse(self):
+        _active.traversals += self.length
+        _active.moves += self.length
+        original(self)
+    return reverse
+
+
+def _counting_iterator(original):
+    @wraps(original)
+    def iterate(self, *args):
+        # Bind the counter now: the generator may be consumed after the block
+        return _count_steps(original(self, *args), _active)
+    return iterate
+
+
+def _count_steps(items, counts):
+    for item in items:
+        if _active is counts:
+            counts.traversals += 1
+        yield item
+
+
+def _list_position(linked_list, data):
+    """Nodes a front-to-back search for data compares, read without changing the list"""
+    compared = 0
+    node = linked_list.head
+    while node is not None:
+        compared += 1
+        if node.data == data:
+            break
+        node = node.next
+    return compared
+
+
+def _tree_path(tree, data, stop_on_match):
+    """Nodes a root-to-leaf descent for data compares, read without changing the tree"""
+    compared = 0
+    node = tree.root
+    while node is not None:
+        compared += 1
+        if stop_on_match and node.data == data:
+            break
+        node = node.left if data < node.data else node.right
+    return compared
+
+
+def _counting_delete(original):
+    @wraps(original)
+    def delete(self, data):
+        compared = _list_position(self, data)
+        deleted = original(self, data)
+        _active.comparisons += compared
+        _active.traversals += max(compared - 1, 0)
+        if deleted:
+            _active.moves += 1
+        return deleted
+    return delete
+
+
+def _counting_contains(original):
+    @wraps(original)
+    def contains(self, data):
+        # Its steps are counted by the patched __iter__
+        _active.comparisons += _list_position(self, data)
+        return original(self, data)
+    return contains
+
+
+def _counting_indexed_delete(original):
+    @wraps(original)
+    def delete(self, data):
+        _active.comparisons += 1
+        deleted = original(self, data)
+        if deleted:
+            _active.moves += 1
+        return deleted
+    return delete
+
+
+def _counting_lookup(original):
+    @wraps(original)
+    def lookup(self, data):
+        _active.comparisons += 1
+        return original(self, data)
+    return lookup
+
+
+def _counting_bst_insert(original):
+    @wraps(original)
+    def insert(self, data):
+        compared = _tree_path(self, data, False)
+        original(self, data)
+        _active.comparisons += compared
+        _active.traversals += max(compared - 1, 0)
+        _active.allocations += 1
+        if compared:
+            _active.moves += 1
+    return insert
+
+
+def _counting_bst_search(original):
+    @wraps(original)
+    def search(self, data):
+        compared = _tree_path(self, data, True)
+        _active.comparisons += compared
+        _active.traversals += max(compared - 1, 0)
+        return original(self, data)
+    return search
+
+
+def _counting_insert_balanced(original):
+    @wraps(original)
+    def insert_balanced(self, node, data):
+        if node is None:
+            _active.allocations += 1
+            _active.moves += 1
+        else:
+            _active.comparisons += 1
+            _active.traversals += 1
+        return original(self, node, data)
+    return insert_balanced
+
+
+def _counting_rotation(original):
+    @wraps(original)
+    def rotate(self, node):
+        _active.moves += 2
+        return original(self, node)
+    return rotate
+
+
+def _counting_sort(original):
+    function = original.__func__
+
+    @wraps(function)
+    def sort(arr, callback=None):
+        # Nested calls (counting_sort handing off to radix_sort) already carry a counter
+        if isinstance(callback, _SortEventCounter):
+            return function(arr, callback)
+        _active.allocations += 1
+        return function(arr, _active.sort_callback(callback))
+    return staticmethod(sort)
+
+
+def _counting_search(original):
+    function = original.__func__
+
+    @wraps(function)
+    def search(arr, target, callback=None):
+        return function(arr, target, _active.probe_callback(callback))
+    return staticmethod(search)
+
+
+def _patches():
+    patches = [
+        (LinkedList, 'append', _counting_append),
+        (LinkedList, 'prepend', _counting_append),
+        (LinkedList, 'extend', _counting_extend),
+        (LinkedList, 'delete', _counting_delete),
+        (LinkedList, 'reverse', _counting_reverse),
+        (LinkedList, 'contains', _counting_contains),
+        (LinkedList, '__iter__', _counting_iterator),
+        (IndexedLinkedList, 'append', _counting_append),
+        (IndexedLinkedList, 'prepend', _counting_append),
+        (IndexedLinkedList, 'extend', _counting_extend),
+        (IndexedLinkedList, 'delete', _counting_indexed_delete),
+        (IndexedLinkedList, 'contains', _counting_lookup),
+        (IndexedLinkedList, 'count', _counting_lookup),
+        (IndexedLinkedList, 'reverse', _counting_reverse),
+        (BinarySearchTree, 'insert', _counting_bst_insert),
+        (BinarySearchTree, 'search', _counting_bst_search),
+        (AVLTree, '_insert_balanced', _counting_insert_balanced),
+        (AVLTree, '_rotate_left', _counting_rotation),
+        (AVLTree, '_rotate_right', _counting_rotation),
+        (SearchAlgorithms, 'linear_search', _counting_search),
+        (SearchAlgorithms, 'binary_search', _counting_search),
+    ]
+    for name in ('iter_inorder', 'iter_preorder', 'iter_postorder', 'iter_level_order', 'range'):
+        patches.append((BinarySearchTree, name, _counting_iterator))
+    for name in vars(SortingAlgorithms):
+        if name.endswith('_sort') and not name.startswith('_'):
+            patches.append((SortingAlgorithms, name, _counting_sort))
+    return patches
+
+
+@contextmanager
+def instrumented(counter=None):
+    """Count operations on the core classes inside the with block; yields the counter"""
+    global _active
+    if _active is not None:
+        raise RuntimeError("instrumented() blocks cannot be nested")
+    counter = counter if counter is not None else OperationCounter()
+    originals = []
+    _active = counter
+    try:
+        for cls, name, make_counting in _patches():
+            original = cls.__dict__[name]
+            originals.append((cls, name, original))
+            setattr(cls, name, make_counting(original))
+        yield counter
+    finally:
+        for cls, name, original in reversed(originals):
+            setattr(cls, name, original)
+        _active = None
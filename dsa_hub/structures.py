@@ -0,0 +1,1239 @@
+"""Core data structures: linked lists, stack, queue and binary search trees"""
+from array import array
+from collections import deque
+from itertools import islice
+from time import monotonic
+
+
+class Node:
+    """Node class for linked list and tree structures"""
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+        self.left = None
+        self.right = None
+
+
+class ListNode:
+    """Compact node for linked lists"""
+
+    __slots__ = ('data', 'next')
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class IndexedListNode(ListNode):
+    """List node that also links back to its predecessor"""
+
+    __slots__ = ('prev',)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.prev = None
+
+
+class CacheNode(IndexedListNode):
+    """Doubly linked node that also remembers the cache key it stores"""
+
+    __slots__ = ('key',)
+
+    def __init__(self, key, data):
+        super().__init__(data)
+        self.key = key
+
+
+class TreeNode:
+    """Compact node for binary trees, augmented with its subtree size"""
+
+    __slots__ = ('data', 'left', 'right', 'size')
+
+    def __init__(self, data):
+        self.data = data
+        self.left = None
+        self.right = None
+        self.size = 1
+
+
+class AVLNode(TreeNode):
+    """Tree node that also tracks the height of its subtree"""
+
+    __slots__ = ('height',)
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.height = 1
+
+
+class LinkedList:
+    """Implementation of a singly linked list"""
+
+    def __init__(self):
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current = self.head
+        while current:
+            yield current.data
+            current = current.next
+
+    def append(self, data):
+        new_node = ListNode(data)
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+
+    def extend(self, iterable):
+        """Append every item of iterable, linking the nodes in one pass"""
+        tail = self.tail
+        count = 0
+        for data in iterable:
+            new_node = ListNode(data)
+            if tail is None:
+                self.head = new_node
+            else:
+                tail.next = new_node
+            tail = new_node
+            count += 1
+        self.tail = tail
+        self.length += count
+
+    def prepend(self, data):
+        new_node = ListNode(data)
+        new_node.next = self.head
+        self.head = new_node
+        if self.tail is None:
+            self.tail = new_node
+        self.length += 1
+
+    def delete(self, data):
+        if not self.head:
+            return False
+
+        if self.head.data == data:
+            self.head = self.head.next
+            if self.head is None:
+                self.tail = None
+            self.length -= 1
+            return True
+
+        current = self.head
+        while current.next:
+            if current.next.data == data:
+                if current.next is self.tail:
+                    self.tail = current
+                current.next = current.next.next
+                self.length -= 1
+                return True
+            current = current.next
+        return False
+
+    def contains(self, data):
+        for item in self:
+            if item == data:
+                return True
+        return False
+
+    def __contains__(self, data):
+        return self.contains(data)
+
+    def display(self):
+        return " -> ".join(map(str, self)) if self.head else "Empty"
+
+    def slice(self, start, count):
+        """Return up to count items beginning at position start, walking only that far"""
+        return list(islice(self, start, start + count))
+
+    def reverse(self):
+        prev = None
+        current = self.head
+        self.tail = current
+        while current:
+            next_temp = current.next
+            current.next = prev
+            prev = current
+            current = next_temp
+        self.head = prev
+
+
+class IndexedLinkedList(LinkedList):
+    """LinkedList with a value index for O(1) average contains() and delete()
+
+    index maps each value to its node, or to a deque of its nodes in list
+    order when the value occurs more than once; every node links back to its
+    predecessor, so delete() unlinks the first match without scanning.
+    Values must be hashable.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.index = {}
+
+    def _add_to_index(self, node, at_front=False):
+        entry = self.index.get(node.data)
+        if entry is None:
+            self.index[node.data] = node
+            return
+        if type(entry) is not deque:
+            entry = self.index[node.data] = deque((entry,))
+        if at_front:
+            entry.appendleft(node)
+        else:
+            entry.append(node)
+
+    def append(self, data):
+        new_node = IndexedListNode(data)
+        new_node.prev = self.tail
+        if not self.head:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+        self._add_to_index(new_node)
+
+    def extend(self, iterable):
+        for data in iterable:
+            self.append(data)
+
+    def prepend(self, data):
+        new_node = IndexedListNode(data)
+        new_node.next = self.head
+        if self.head is None:
+            self.tail = new_node
+        else:
+            self.head.prev = new_node
+        self.head = new_node
+        self.length += 1
+        self._add_to_index(new_node, at_front=True)
+
+    def delete(self, data):
+        entry = self.index.get(data)
+        if entry is None:
+            return False
+        if type(entry) is deque:
+            node = entry.popleft()
+            if len(entry) == 1:
+                self.index[data] = entry[0]
+        else:
+            node = entry
+            del self.index[data]
+
+        if node.prev is None:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        self.length -= 1
+        return True
+
+    def contains(self, data):
+        return data in self.index
+
+    def count(self, data):
+        entry = self.index.get(data)
+        if entry is None:
+            return 0
+        return len(entry) if type(entry) is deque else 1
+
+    def reverse(self):
+        current = self.head
+        self.head, self.tail = self.tail, self.head
+        while current:
+            current.next, current.prev = current.prev, current.next
+            current = current.prev
+        for entry in self.index.values():
+            if type(entry) is deque:
+                entry.reverse()
+
+
+class DoublyLinkedList:
+    """Doubly linked list around a sentinel node, with O(1) unlinking of any node
+
+    append() and prepend() return the new node; pass it back to remove() or
+    move_to_front() later. The sentinel closes the ring (sentinel.next is the
+    head, sentinel.prev the tail), so no operation has an empty-list special case.
+    """
+
+    def __init__(self):
+        self.sentinel = IndexedListNode(None)
+        self.sentinel.next = self.sentinel.prev = self.sentinel
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        current = self.sentinel.next
+        while current is not self.sentinel:
+            yield current.data
+            current = current.next
+
+    @property
+    def head(self):
+        return self.sentinel.next if self.length else None
+
+    @property
+    def tail(self):
+        return self.sentinel.prev if self.length else None
+
+    def _link_after(self, prev, node):
+        node.prev = prev
+        node.next = prev.next
+        prev.next.prev = node
+        prev.next = node
+        self.length += 1
+        return node
+
+    def append(self, data):
+        return self._link_after(self.sentinel.prev, IndexedListNode(data))
+
+    def prepend(self, data):
+        return self._link_after(self.sentinel, IndexedListNode(data))
+
+    def push_front(self, node):
+        """Link an unattached node in as the new head"""
+        return self._link_after(self.sentinel, node)
+
+    def remove(self, node):
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = node.next = None
+        self.length -= 1
+        return node.data
+
+    def move_to_front(self, node):
+        if self.sentinel.next is node:
+            return
+        node.prev.next = node.next
+        node.next.prev = node.prev
+        node.prev = self.sentinel
+        node.next = self.sentinel.next
+        self.sentinel.next.prev = node
+        self.sentinel.next = node
+
+    def pop_tail(self):
+        """Unlink and return the tail node, or None if the list is empty"""
+        if not self.length:
+            return None
+        node = self.sentinel.prev
+        self.remove(node)
+        return node
+
+    def display(self):
+        return " <-> ".join(map(str, self)) if self.length else "Empty"
+
+
+class LRUCache:
+    """Fixed-capacity key/value cache that evicts the least recently used entry
+
+    entries maps each key to its node in order, a DoublyLinkedList kept
+    most-recent first, so get(), put() and eviction are all O(1).
+    """
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.entries = {}
+        self.order = DoublyLinkedList()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, key):
+        """Membership test; does not count as a use or touch the statistics"""
+        return key in self.entries
+
+    def get(self, key, default=None):
+        node = self.entries.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.move_to_front(node)
+        return node.data
+
+    def put(self, key, value):
+        node = self.entries.get(key)
+        if node is not None:
+            node.data = value
+            self.order.move_to_front(node)
+            return
+        if len(self.entries) >= self.capacity:
+            evicted = self.order.pop_tail()
+            del self.entries[evicted.key]
+            self.evictions += 1
+        self.entries[key] = self.order.push_front(CacheNode(key, value))
+
+    def delete(self, key):
+        node = self.entries.pop(key, None)
+        if node is None:
+            return False
+        self.order.remove(node)
+        return True
+
+    def keys(self):
+        """Keys from most to least recently used"""
+        current = self.order.sentinel.next
+        while current is not self.order.sentinel:
+            yield current.key
+            current = current.next
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "size": len(self.entries),
+            "capacity": self.capacity,
+        }
+
+
+class Stack:
+    """Implementation of a stack using list"""
+
+    def __init__(self):
+        self.items = []
+
+    def push(self, item):
+        self.items.append(item)
+
+    def pop(self):
+        if not self.is_empty():
+            return self.items.pop()
+        return None
+
+    def peek(self):
+        if not self.is_empty():
+            return self.items[-1]
+        return None
+
+    def is_empty(self):
+        return len(self.items) == 0
+
+    def size(self):
+        return len(self.items)
+
+    def display(self):
+        return str(self.items) if self.items else "Empty"
+
+
+class Queue:
+    """Implementation of a queue using deque"""
+
+    def __init__(self):
+        self.items = deque()
+
+    def enqueue(self, item):
+        self.items.append(item)
+
+    def dequeue(self):
+        if not self.is_empty():
+            return self.items.popleft()
+        return None
+
+    def front(self):
+        if not self.is_empty():
+            return self.items[0]
+        return None
+
+    def is_empty(self):
+        return len(self.items) == 0
+
+    def size(self):
+        return len(self.items)
+
+    def display(self):
+        return str(list(self.items)) if self.items else "Empty"
+
+    def rear(self):
+        if not self.is_empty():
+            return self.items[-1]
+        return None
+
+    def peek_range(self, start, count):
+        """Return up to count items from position start (0 = front), walking from the nearer end"""
+        size = len(self.items)
+        stop = min(start + count, size)
+        if start >= stop:
+            return []
+        if start > size - stop:
+            return list(islice(reversed(self.items), size - stop, size - start))[::-1]
+        return list(islice(self.items, start, stop))
+
+
+# Overflow policies for the bounded ring buffers: what to do with a new item when full
+BLOCK = 'block'              # wait until a consumer makes room (thread-safe mode)
+DROP_OLDEST = 'drop-oldest'  # overwrite the oldest item
+REJECT = 'reject'            # refuse the new item
+OVERFLOW_POLICIES = (BLOCK, DROP_OLDEST, REJECT)
+
+
+class RingBuffer:
+    """Fixed-capacity circular storage shared by BoundedQueue and BoundedStack
+
+    Slots are preallocated once: a list, or an array of the given typecode
+    (e.g. 'q' or 'd') for compact numeric payloads. Items live in
+    storage[start], storage[start + 1], ... wrapping around, oldest first.
+    Buffers with the BLOCK policy guard every operation with a condition
+    variable so producers and consumers can run on different threads; the
+    other policies skip locking, like Queue and Stack.
+    """
+
+    def __init__(self, capacity, overflow=REJECT, typecode=None):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"overflow must be one of {', '.join(OVERFLOW_POLICIES)}")
+        self.capacity = capacity
+        self.overflow = overflow
+        self.typecode = typecode
+        self.storage = array(typecode, [0]) * capacity if typecode else [None] * capacity
+        self.start = 0
+        self.count = 0
+        self.dropped = 0
+        self.rejected = 0
+        self.not_full = None
+        if overflow == BLOCK:
+            import threading  # Only blocking buffers need it; keeps the core import light
+            self.not_full = threading.Condition()
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        """Items oldest first"""
+        storage, capacity = self.storage, self.capacity
+        for offset in range(self.count):
+            yield storage[(self.start + offset) % capacity]
+
+    def is_empty(self):
+        return self.count == 0
+
+    def is_full(self):
+        return self.count == self.capacity
+
+    def size(self):
+        return self.count
+
+    def display(self):
+        return str(list(self)) if self.count else "Empty"
+
+    def _has_room(self):
+        return self.count < self.capacity
+
+    def _add(self, item):
+        """Store item after the newest one, applying the overflow policy; False if rejected"""
+        count = self.count
+        capacity = self.capacity
+        if count < capacity:
+            index = self.start + count
+            self.storage[index - capacity if index >= capacity else index] = item
+            self.count = count + 1
+            return True
+        if self.overflow != DROP_OLDEST:
+            self.rejected += 1
+            return False
+        start = self.start
+        self.storage[start] = item
+        self.start = 0 if start + 1 == capacity else start + 1
+        self.dropped += 1
+        return True
+
+    def _add_batch(self, items):
+        """Store as many of items as the policy allows, oldest first; return how many were accepted
+
+        Under DROP_OLDEST every item is accepted, even those a long batch
+        pushes straight back out, as if they had been added one at a time.
+        """
+        capacity = self.capacity
+        accepted = len(items)
+        if self.overflow == DROP_OLDEST:
+            if len(items) >= capacity:
+                self.dropped += self.count + len(items) - capacity
+                self.start = self.count = 0
+                items = items[len(items) - capacity:]
+            else:
+                excess = max(0, self.count + len(items) - capacity)
+                self.start = (self.start + excess) % capacity
+                self.count -= excess
+                self.dropped += excess
+            stored = len(items)
+        else:
+            stored = accepted = min(len(items), capacity - self.count)
+            self.rejected += len(items) - stored
+            items = items[:stored]
+        if self.typecode and not isinstance(items, array):
+            items = array(self.typecode, items)
+
+        end = (self.start + self.count) % capacity
+        first = min(stored, capacity - end)
+        self.storage[end:end + first] = items[:first]
+        self.storage[:stored - first] = items[first:]
+        self.count += stored
+        return accepted
+
+    def _take_one(self, newest):
+        count = self.count
+        if not count:
+            return None
+        self.count = count - 1
+        start = self.start
+        if newest:
+            index = (start + count - 1) % self.capacity
+        else:
+            index = start
+            self.start = 0 if start + 1 == self.capacity else start + 1
+        item = self.storage[index]
+        if self.typecode is None:
+            self.storage[index] = None
+        return item
+
+    def _take(self, count, newest):
+        """Remove and return up to count items from the newest or oldest end, in removal order"""
+        count = min(count, self.count)
+        capacity = self.capacity
+        if newest:
+            first = (self.start + self.count - count) % capacity
+        else:
+            first = self.start
+        # The run may wrap: storage[first:] then storage[:rest]
+        head = min(count, capacity - first)
+        rest = count - head
+        items = self.storage[first:first + head] + self.storage[:rest]
+        if self.typecode:
+            items = items.tolist()
+        else:
+            self.storage[first:first + head] = [None] * head  # Release the references
+            self.storage[:rest] = [None] * rest
+        if not newest:
+            self.start = (self.start + count) % capacity
+        self.count -= count
+        if newest:
+            items.reverse()
+        return items
+
+    def _put_blocking(self, item, timeout):
+        with self.not_full:
+            if not self.not_full.wait_for(self._has_room, timeout):
+                self.rejected += 1
+                return False
+            return self._add(item)
+
+    def _put_many(self, items, timeout):
+        items = items if isinstance(items, (list, array)) else list(items)
+        if self.not_full is None:
+            return self._add_batch(items)
+        stored = 0
+        # One deadline for the whole batch, however many waits it takes
+        deadline = None if timeout is None else monotonic() + timeout
+        with self.not_full:
+            while stored < len(items):
+                remaining = None if deadline is None else max(0, deadline - monotonic())
+                if not self.not_full.wait_for(self._has_room, remaining):
+                    self.rejected += len(items) - stored
+                    break
+                stored += self._add_batch(items[stored:stored + self.capacity - self.count])
+        return stored
+
+    def _get_one_blocking(self, newest):
+        with self.not_full:
+            if self.count:
+                self.not_full.notify()
+            return self._take_one(newest)
+
+    def _get(self, count, newest):
+        if self.not_full is None:
+            return self._take(count, newest)
+        with self.not_full:
+            items = self._take(count, newest)
+            if items:
+                self.not_full.notify(len(items))
+            return items
+
+
+class BoundedQueue(RingBuffer):
+    """Fixed-capacity FIFO queue on a ring buffer, with Queue's method names
+
+    enqueue() returns False when the item was rejected (REJECT policy, or a
+    BLOCK wait that timed out); dequeue() returns None when empty.
+    """
+
+    def enqueue(self, item, timeout=None):
+        if self.not_full is None:
+            return self._add(item)
+        return self._put_blocking(item, timeout)
+
+    def enqueue_many(self, items, timeout=None):
+        """Enqueue items in order; return how many were accepted"""
+        return self._put_many(items, timeout)
+
+    def dequeue(self):
+        if self.not_full is None:
+            return self._take_one(False)
+        return self._get_one_blocking(False)
+
+    def dequeue_many(self, count):
+        """Remove and return up to count items, front first"""
+        return self._get(count, newest=False)
+
+    def front(self):
+        return self.storage[self.start] if self.count else None
+
+    def rear(self):
+        return self.storage[(self.start + self.count - 1) % self.capacity] if self.count else None
+
+    def peek_range(self, start, count):
+        """Return up to count items from position start (0 = front)"""
+        stop = min(start + count, self.count)
+        return [self.storage[(self.start + i) % self.capacity] for i in range(start, stop)]
+
+
+class BoundedStack(RingBuffer):
+    """Fixed-capacity LIFO stack on a ring buffer, with Stack's method names
+
+    DROP_OLDEST discards the bottom item to make room, so the stack keeps
+    the most recent capacity pushes.
+    """
+
+    def push(self, item, timeout=None):
+        if self.not_full is None:
+            return self._add(item)
+        return self._put_blocking(item, timeout)
+
+    def push_many(self, items, timeout=None):
+        """Push items in order (the last one ends up on top); return how many were accepted"""
+        return self._put_many(items, timeout)
+
+    def pop(self):
+        if self.not_full is None:
+            return self._take_one(True)
+        return self._get_one_blocking(True)
+
+    def pop_many(self, count):
+        """Pop up to count items, top first"""
+        return self._get(count, newest=True)
+
+    def peek(self):
+        return self.storage[(self.start + self.count - 1) % self.capacity] if self.count else None
+
+
+class HeapEntry:
+    """A key and optional item held by a BinaryHeap; index is its current slot (-1 once popped)"""
+
+    __slots__ = ('key', 'item', 'index')
+
+    def __init__(self, key, item, index):
+        self.key = key
+        self.item = item
+        self.index = index
+
+
+class BinaryHeap:
+    """Array-backed min-heap; arity > 2 makes it a d-ary heap
+
+    Items are optional: pop() and peek() return an entry's item, or its key
+    when it was pushed without one (so a heap of plain numbers just works).
+    push() returns the HeapEntry it stores. Entries always know their slot,
+    so decrease_key(entry, key) sifts straight up from there instead of
+    searching. heapify() builds a heap from any iterable of keys in O(n).
+    """
+
+    def __init__(self, arity=2):
+        if arity < 2:
+            raise ValueError("arity must be at least 2")
+        self.arity = arity
+        self.entries = []
+
+    @classmethod
+    def heapify(cls, keys, arity=2):
+        heap = cls(arity)
+        heap.entries = [HeapEntry(key, None, i) for i, key in enumerate(keys)]
+        # Sift down every internal node, deepest first: O(n) overall
+        for i in range((len(heap.entries) - 2) // arity, -1, -1):
+            heap._sift_down(i)
+        return heap
+
+    def __len__(self):
+        return len(self.entries)
+
+    def is_empty(self):
+        return not self.entries
+
+    def size(self):
+        return len(self.entries)
+
+    def keys(self):
+        """Keys in array order (index 0 is the minimum)"""
+        return [entry.key for entry in self.entries]
+
+    def display(self):
+        return str(self.keys()) if self.entries else "Empty"
+
+    def push(self, key, item=None):
+        """Add key, optionally carrying item, and return its entry"""
+        entry = HeapEntry(key, item, len(self.entries))
+        self.entries.append(entry)
+        self._sift_up(entry.index)
+        return entry
+
+    @staticmethod
+    def _value(entry):
+        return entry.key if entry.item is None else entry.item
+
+    def peek(self):
+        return self._value(self.entries[0]) if self.entries else None
+
+    def min_key(self):
+        return self.entries[0].key if self.entries else None
+
+    def pop(self):
+        """Remove and return the item with the smallest key, or None if empty"""
+        if not self.entries:
+            return None
+        top = self.entries[0]
+        last = self.entries.pop()
+        if self.entries:
+            self.entries[0] = last
+            last.index = 0
+            self._sift_down(0)
+        top.index = -1
+        return self._value(top)
+
+    def decrease_key(self, entry, key):
+        index = entry.index
+        if index < 0 or index >= len(self.entries) or self.entries[index] is not entry:
+            raise ValueError("entry is not in this heap")
+        if entry.key < key:
+            raise ValueError("new key is larger than the current key")
+        entry.key = key
+        self._sift_up(index)
+
+    def _sift_up(self, index):
+        entries = self.entries
+        entry = entries[index]
+        key = entry.key
+        while index:
+            parent_index = (index - 1) // self.arity
+            parent = entries[parent_index]
+            if not key < parent.key:
+                break
+            entries[index] = parent
+            parent.index = index
+            index = parent_index
+        entries[index] = entry
+        entry.index = index
+
+    def _sift_down(self, index):
+        entries = self.entries
+        size = len(entries)
+        arity = self.arity
+        entry = entries[index]
+        key = entry.key
+        while True:
+            first = arity * index + 1
+            if first >= size:
+                break
+            child_index = first
+            child = entries[first]
+            if arity == 2:
+                if first + 1 < size and entries[first + 1].key < child.key:
+                    child_index = first + 1
+                    child = entries[child_index]
+            else:
+                for candidate in range(first + 1, min(first + arity, size)):
+                    if entries[candidate].key < child.key:
+                        child_index = candidate
+                        child = entries[candidate]
+            if not child.key < key:
+                break
+            entries[index] = child
+            child.index = index
+            index = child_index
+        entries[index] = entry
+        entry.index = index
+
+
+class BinarySearchTree:
+    """Implementation of a Binary Search Tree"""
+
+    node_class = TreeNode
+
+    def __init__(self):
+        self.root = None
+        self.levels = 0  # height, kept up to date by insert since keys are never removed
+
+    @classmethod
+    def from_sorted(cls, iterable):
+        """Build a perfectly balanced tree from ascending keys in O(n)"""
+        keys = list(iterable)
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            raise ValueError("from_sorted requires keys in ascending order")
+        tree = cls()
+        tree.root = tree._build_balanced(keys, 0, len(keys) - 1)
+        tree.levels = len(keys).bit_length()
+        return tree
+
+    def _build_balanced(self, keys, lo, hi):
+        if lo > hi:
+            return None
+        mid = (lo + hi) // 2
+        node = self.node_class(keys[mid])
+        node.left = self._build_balanced(keys, lo, mid - 1)
+        node.right = self._build_balanced(keys, mid + 1, hi)
+        node.size = hi - lo + 1
+        return node
+
+    def __len__(self):
+        return self.root.size if self.root else 0
+
+    def insert(self, data):
+        new_node = self.node_class(data)
+        if not self.root:
+            self.root = new_node
+            self.levels = 1
+            return
+        node = self.root
+        depth = 1
+        while True:
+            node.size += 1
+            depth += 1
+            if data < node.data:
+                if node.left is None:
+                    node.left = new_node
+                    break
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = new_node
+                    break
+                node = node.right
+        self.levels = max(self.levels, depth)
+
+    def search(self, data):
+        node = self.root
+        while node is not None:
+            if node.data == data:
+                return True
+            node = node.left if data < node.data else node.right
+        return False
+
+    @staticmethod
+    def _size(node):
+        return node.size if node else 0
+
+    def select(self, k):
+        """Return the k-th smallest key (0-based)"""
+        if not 0 <= k < len(self):
+            raise IndexError("select index out of range")
+        node = self.root
+        while True:
+            left_size = self._size(node.left)
+            if k < left_size:
+                node = node.left
+            elif k == left_size:
+                return node.data
+            else:
+                k -= left_size + 1
+                node = node.right
+
+    def rank(self, data):
+        """Return the number of keys strictly smaller than data"""
+        rank = 0
+        node = self.root
+        while node:
+            if data <= node.data:
+                node = node.left
+            else:
+                rank += self._size(node.left) + 1
+                node = node.right
+        return rank
+
+    def range(self, lo, hi):
+        """Yield keys in [lo, hi] in sorted order, skipping subtrees outside it"""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                if node.data < lo:
+                    node = node.right
+                else:
+                    stack.append(node)
+                    node = node.left
+            if not stack:
+                return
+            node = stack.pop()
+            if node.data > hi:
+                return
+            yield node.data
+            node = node.right
+
+    def floor(self, data):
+        """Return the largest key <= data, or None"""
+        result = None
+        node = self.root
+        while node:
+            if node.data == data:
+                return node.data
+            if node.data < data:
+                result = node.data
+                node = node.right
+            else:
+                node = node.left
+        return result
+
+    def ceiling(self, data):
+        """Return the smallest key >= data, or None"""
+        result = None
+        node = self.root
+        while node:
+            if node.data == data:
+                return node.data
+            if node.data > data:
+                result = node.data
+                node = node.left
+            else:
+                node = node.right
+        return result
+
+    def inorder_traversal(self):
+        return list(self.iter_inorder())
+
+    def iter_inorder(self):
+        """Yield keys in sorted order without recursion"""
+        stack = []
+        node = self.root
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.data
+            node = node.right
+
+    def iter_preorder(self):
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+
+    def iter_postorder(self):
+        stack = []
+        node = self.root
+        last_visited = None
+        while stack or node:
+            while node:
+                stack.append(node)
+                node = node.left
+            peek = stack[-1]
+            if peek.right and last_visited is not peek.right:
+                node = peek.right
+            else:
+                yield peek.data
+                last_visited = stack.pop()
+
+    def iter_level_order(self):
+        queue = deque([self.root] if self.root else [])
+        while queue:
+            node = queue.popleft()
+            yield node.data
+            if node.left:
+                queue.append(node.left)
+            if node.right:
+                queue.append(node.right)
+
+    def height(self):
+        """Number of levels in the tree (0 when empty)"""
+        return self.levels
+
+
+class AVLTree(BinarySearchTree):
+    """Self-balancing Binary Search Tree (AVL), O(log n) insert and search"""
+
+    node_class = AVLNode
+
+    def _build_balanced(self, keys, lo, hi):
+        node = super()._build_balanced(keys, lo, hi)
+        if node:
+            self._update_node(node)
+        return node
+
+    def insert(self, data):
+        self.root = self._insert_balanced(self.root, data)
+
+    def _insert_balanced(self, node, data):
+        if node is None:
+            return self.node_class(data)
+        if data < node.data:
+            node.left = self._insert_balanced(node.left, data)
+        else:
+            node.right = self._insert_balanced(node.right, data)
+        return self._rebalance(node)
+
+    def height(self):
+        return self._height(self.root)
+
+    @staticmethod
+    def _height(node):
+        return node.height if node else 0
+
+    def _update_node(self, node):
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+        node.size = 1 + self._size(node.left) + self._size(node.right)
+
+    def _balance_factor(self, node):
+        return self._height(node.left) - self._height(node.right)
+
+    def _rotate_left(self, node):
+        pivot = node.right
+        node.right = pivot.left
+        pivot.left = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def _rotate_right(self, node):
+        pivot = node.left
+        node.left = pivot.right
+        pivot.right = node
+        self._update_node(node)
+        self._update_node(pivot)
+        return pivot
+
+    def _rebalance(self, node):
+        self._update_node(node)
+        balance = self._balance_factor(node)
+        if balance > 1:
+            if self._balance_factor(node.left) < 0:
+                node.left = self._rotate_left(node.left)
+            return self._rotate_right(node)
+        if balance < -1:
+            if self._balance_factor(node.right) > 0:
+                node.right = self._rotate_right(node.right)
+            return self._rotate_left(node)
+        return node
+
+
+class ArrayBinarySearchTree:
+    """Compact BST stored in parallel key/left/right arrays for read-mostly use"""
+
+    NIL = -1
+
+    def __init__(self, typecode='q'):
+        self.keys = array(typecode)
+        self.left = array('i')
+        self.right = array('i')
+        self.root = self.NIL
+
+    def __len__(self):
+        return len(self.keys)
+
+    @classmethod
+    def from_sorted(cls, iterable, typecode='q'):
+        """Build a balanced tree in O(n), laid out level by level for locality"""
+        keys = list(iterable)
+        if any(keys[i] > keys[i + 1] for i in range(len(keys) - 1)):
+            raise ValueError("from_sorted requires keys in ascending order")
+        tree = cls(typecode)
+        if not keys:
+            return tree
+        n = len(keys)
+        tree.left = array('i', [cls.NIL]) * n
+        tree.right = array('i', [cls.NIL]) * n
+        ranges = deque([(0, n - 1, cls.NIL, None)])
+        while ranges:
+            lo, hi, parent, side = ranges.popleft()
+            mid = (lo + hi) // 2
+            index = len(tree.keys)
+            tree.keys.append(keys[mid])
+            if side is not None:
+                side[parent] = index
+            if lo < mid:
+                ranges.append((lo, mid - 1, index, tree.left))
+            if mid < hi:
+                ranges.append((mid + 1, hi, index, tree.right))
+        tree.root = 0
+        return tree
+
+    @classmethod
+    def from_tree(cls, tree, typecode='q'):
+        return cls.from_sorted(tree.iter_inorder(), typecode)
+
+    def insert(self, data):
+        index = len(self.keys)
+        self.keys.append(data)
+        self.left.append(self.NIL)
+        self.right.append(self.NIL)
+        if self.root == self.NIL:
+            self.root = index
+            return
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while True:
+            if data < keys[node]:
+                if left[node] == self.NIL:
+                    left[node] = index
+                    return
+                node = left[node]
+            else:
+                if right[node] == self.NIL:
+                    right[node] = index
+                    return
+                node = right[node]
+
+    def search(self, data):
+        keys, left, right = self.keys, self.left, self.right
+        node = self.root
+        while node != self.NIL:
+            key = keys[node]
+            if key == data:
+                return True
+            node = left[node] if data < key else right[node]
+        return False
+
+    def inorder_traversal(self):
+        return list(self.iter_inorder())
+
+    def iter_inorder(self):
+        keys, left, right = self.keys, self.left, self.right
+        stack = []
+        node = self.root
+        while stack or node != self.NIL:
+            while node != self.NIL:
+                stack.append(node)
+                node = left[node]
+            node = stack.pop()
+            yield keys[node]
+            node = right[node]
+
+    def height(self):
+        levels = 0
+        level = [self.root] if self.root != self.NIL else []
+        while level:
+            levels += 1
+            level = [child for node in level for child in (self.left[node], self.right[node])
+                     if child != self.NIL]
+        return levels
@@ -0,0 +1,126 @@
+"""Optional NumPy engine for sorting and searching large integer arrays
+
+NumPy is not a dependency. When it is importable, sort() hands integer
+lists of at least VECTORIZE_THRESHOLD elements to np.sort, and
+batch_binary_search() uses np.searchsorted for that many targets. A single
+linear_search() (mask + argmax) or binary_search() (searchsorted) is only
+vectorized for an ndarray from as_array(), since converting a list costs as
+much as the search. Integer arrays of other dtypes are widened to int64
+first, so a key outside their range is simply not found. Everything else,
+and every call with a step callback, goes through the pure-Python
+SortingAlgorithms/SearchAlgorithms.
+
+Results match the pure-Python path: sorts return the same list, and searches
+return -1 exactly when the pure search does. With duplicate keys
+binary_search may return a different index of an equal key (NumPy reports
+the leftmost one).
+"""
+from .algorithms import SortingAlgorithms, SearchAlgorithms
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+HAVE_NUMPY = np is not None
+VECTORIZE_THRESHOLD = 10_000
+
+INT64_MIN = -(1 << 63)
+INT64_MAX = (1 << 63) - 1
+
+# np.sort kernel closest to each algorithm; the output is the same either way
+NUMPY_KINDS = {
+    "merge": "stable",
+    "counting": "stable",
+    "radix": "stable",
+    "heap": "heapsort",
+}
+
+
+def as_array(values):
+    """values as an int64 ndarray, or None when NumPy is missing or the values are not all int64 integers"""
+    if np is None:
+        return None
+    if isinstance(values, np.ndarray):
+        if values.ndim != 1 or values.dtype.kind not in "iu":
+            return None
+        if values.dtype == np.int64:
+            return values
+        # Narrower or unsigned arrays are widened, so every int64 key compares exactly
+        if values.dtype == np.uint64 and len(values) and values.max() > INT64_MAX:
+            return None
+        return values.astype(np.int64)
+    if not len(values):
+        return np.empty(0, dtype=np.int64)
+    try:
+        array = np.array(values)
+    except (OverflowError, ValueError):
+        return None
+    # Floats, bools, strings and ints past int64 come out with another dtype
+    return array if array.dtype.kind == "i" and array.ndim == 1 else None
+
+
+def _is_key(target):
+    return type(target) is int and INT64_MIN <= target <= INT64_MAX
+
+
+def _large_array(values, callback=None):
+    if not HAVE_NUMPY or callback is not None or len(values) < VECTORIZE_THRESHOLD:
+        return None
+    return as_array(values)
+
+
+def _key_array(arr, target, callback):
+    if not HAVE_NUMPY or callback is not None or not isinstance(arr, np.ndarray) or not _is_key(target):
+        return None
+    return as_array(arr)
+
+
+def use_numpy(values, callback=None):
+    """True when sort() would hand values to NumPy"""
+    return _large_array(values, callback) is not None
+
+
+def sort(arr, algorithm="quick", callback=None):
+    """Sorted copy of arr, vectorized for large integer inputs, else via SortingAlgorithms"""
+    values = _large_array(arr, callback)
+    if values is not None:
+        return np.sort(values, kind=NUMPY_KINDS.get(algorithm, "quicksort")).tolist()
+    return getattr(SortingAlgorithms, f"{algorithm}_sort")(arr, callback)
+
+
+def linear_search(arr, target, callback=None):
+    # Like binary_search, only arrays: converting a list costs about as much as scanning it
+    values = _key_array(arr, target, callback)
+    if values is not None:
+        if not len(values):
+            return -1
+        matches = values == target
+        index = int(matches.argmax())
+        return index if matches[index] else -1
+    return SearchAlgorithms.linear_search(arr, target, callback)
+
+
+def binary_search(sorted_arr, target, callback=None):
+    values = _key_array(sorted_arr, target, callback)
+    if values is not None:
+        return _searchsorted(values, [target])[0]
+    return SearchAlgorithms.binary_search(sorted_arr, target, callback)
+
+
+def batch_binary_search(sorted_arr, targets):
+    """Index of each target in sorted_arr (-1 when absent), searching them all at once"""
+    if HAVE_NUMPY and (isinstance(sorted_arr, np.ndarray) or len(targets) >= VECTORIZE_THRESHOLD):
+        values = as_array(sorted_arr)
+        keys = as_array(targets)
+        if values is not None and keys is not None:
+            return _searchsorted(values, keys)
+    return [SearchAlgorithms.binary_search(sorted_arr, target) for target in targets]
+
+
+def _searchsorted(values, keys):
+    keys = np.asarray(keys, dtype=values.dtype)
+    positions = np.searchsorted(values, keys)
+    found = positions < len(values)
+    found[found] = values[positions[found]] == keys[found]
+    return np.where(found, positions, -1).tolist()
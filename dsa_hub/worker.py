@@ -0,0 +1,60 @@
+"""Background execution of algorithm runs with progress messages and cancellation"""
+import threading
+from queue import SimpleQueue, Empty
+
+
+class RunCancelled(Exception):
+    """Raised inside a worker job when its run has been cancelled"""
+
+
+class AlgorithmWorker:
+    """Runs a job on a background thread and queues its progress messages
+
+    The job is called as job(worker) and reports back with worker.post(kind, payload);
+    the GUI drains the messages from the Tk thread. A job that calls
+    check_cancelled() stops with a 'cancelled' message once cancel() is requested.
+    """
+
+    def __init__(self, job):
+        self.job = job
+        self.messages = SimpleQueue()
+        self._cancel_event = threading.Event()
+        self.abandoned = False
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self.thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.job(self)
+        except RunCancelled:
+            self.post('cancelled')
+        except Exception as e:
+            self.post('error', e)
+
+    def post(self, kind, payload=None):
+        self.messages.put((kind, payload))
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def abandon(self):
+        """Cancel and tell the consumer to ignore anything still queued"""
+        self.abandoned = True
+        self._cancel_event.set()
+
+    def cancelled(self):
+        return self._cancel_event.is_set()
+
+    def check_cancelled(self):
+        if self._cancel_event.is_set():
+            raise RunCancelled()
+
+    def drain(self):
+        while True:
+            try:
+                yield self.messages.get_nowait()
+            except Empty:
+                return